@@ -1,27 +1,59 @@
-from flask import Flask, render_template, session
-import os
-from datetime import datetime
+from flask import Flask, render_template
+import importlib
+import threading
 
 # Import configuration from the root config.py
-from config import UPLOAD_FOLDER, JSON_SUBFOLDER, SECRET_KEY
+from config import UPLOAD_FOLDER, JSON_SUBFOLDER, SECRET_KEY, PREWARM_IMPORTS, ensure_user_dirs
 
-# Import blueprints
+# Import blueprints (pandas / numpy / numexpr / plotly are imported lazily inside the routes)
 from app.routes import data_bp
 from app.model_routes import model_bp
 
-app = Flask(__name__)
-app.secret_key = SECRET_KEY
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['JSON_SUBFOLDER'] = JSON_SUBFOLDER # Pass JSON_SUBFOLDER to app config
+# 初回リクエスト時まで読み込みを遅延させる重いモジュール
+HEAVY_MODULES = ('app.data_utils', 'app.plot_utils', 'app.model_evaluator')
 
-# Register blueprints
-app.register_blueprint(data_bp)
-app.register_blueprint(model_bp)
 
+def _prewarm_heavy_modules(logger):
+    """
+    重いモジュールをバックグラウンドで読み込み、初回のデータ処理リクエストを高速化します。
+    """
+    for module_name in HEAVY_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            logger.warning(f"Failed to prewarm {module_name}: {e}")
 
-@app.route('/')
-def index():
+
+def create_app(prewarm=None):
     """
-    メインページを表示します。
+    Flaskアプリケーションを生成して返します。
+    prewarmがTrueの場合（未指定時はconfig.PREWARM_IMPORTS）、
+    重いモジュールをバックグラウンドスレッドで事前に読み込みます。
+    事前読み込みはfork後のワーカー内で行う必要があります（gunicorn --preload のように
+    マスターで生成するとインポートロック保持中にforkされ、ワーカーが停止する恐れがあります）。
     """
-    return render_template('index.html')
\ No newline at end of file
+    ensure_user_dirs()
+
+    app = Flask(__name__)
+    app.secret_key = SECRET_KEY
+    app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+    app.config['JSON_SUBFOLDER'] = JSON_SUBFOLDER # Pass JSON_SUBFOLDER to app config
+
+    # Register blueprints
+    app.register_blueprint(data_bp)
+    app.register_blueprint(model_bp)
+
+    @app.route('/')
+    def index():
+        """
+        メインページを表示します。
+        """
+        return render_template('index.html')
+
+    if prewarm is None:
+        prewarm = PREWARM_IMPORTS
+    if prewarm:
+        threading.Thread(target=_prewarm_heavy_modules, args=(app.logger,),
+                         name='mierio-prewarm', daemon=True).start()
+
+    return app
@@ -4,8 +4,7 @@ import json
 import re # 正規表現を扱うためにインポート
 from datetime import datetime
 from flask import Blueprint, request, jsonify, session, current_app
-import pandas as pd
-from app.model_evaluator import calculate_targets # 新しくインポート
+# pandas と model_evaluator（numexpr）は起動を速くするため、run_calculation_demo 内で遅延インポートする
 
 model_bp = Blueprint('model_bp', __name__)
 
@@ -198,6 +197,9 @@ def run_calculation_demo():
     current_target_filepath = session.get('target_filepath')
     feature_headers_session = session.get('feature_headers', [])
 
+    import pandas as pd
+    from app.model_evaluator import calculate_targets
+
     try:
         df_feature = pd.read_csv(current_feature_filepath)
         if df_feature.empty:
@@ -1,9 +1,6 @@
 from flask import Blueprint, request, jsonify, session, current_app
-import pandas as pd
-import numpy as np
 import os
-from app.data_utils import load_and_merge_csvs, filter_dataframe, convert_columns_to_numeric
-from app.plot_utils import generate_scatter_plot
+# pandas / numpy / plotly は起動を速くするため、必要なルート内で遅延インポートする
 
 data_bp = Blueprint('data_bp', __name__)
 
@@ -28,6 +25,8 @@ def upload_csv():
         filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
         file.save(filepath)
         
+        import pandas as pd
+
         try:
             df = pd.read_csv(filepath)
             headers = df.columns.tolist()
@@ -67,6 +66,10 @@ def get_plot_data():
     if not feature_filepath or not target_filepath:
         return jsonify({'error': 'Feature or Target CSV file not uploaded.'}), 400
 
+    import numpy as np
+    from app.data_utils import load_and_merge_csvs, filter_dataframe, convert_columns_to_numeric
+    from app.plot_utils import generate_scatter_plot
+
     try:
         df_merged = load_and_merge_csvs(feature_filepath, target_filepath)
         df_filtered = filter_dataframe(df_merged, feature_params)
@@ -0,0 +1,92 @@
+"""
+ワーカー起動の所要時間を計測するベンチマーク。
+
+各計測は新しいPythonプロセスで実行し、インポートキャッシュの影響を排除します。
+計測値は以下の3つです。
+  - process [ms] : 親プロセスから見た子プロセスの起動から終了までの実時間
+                   （インタプリタ起動・site読み込みを含み、データ要求の完了まで）
+  - ready [ms]   : 子プロセス内でスクリプト開始から最初の GET / 応答までの時間
+  - data [ms]    : 子プロセス内でスクリプト開始から最初の POST /upload_csv 応答までの時間
+                   （pandasなどの重いモジュールの読み込みコストはここに現れる）
+
+モード:
+  - lazy    : create_app() のみ（重いモジュールは初回データ処理時に読み込む）
+  - prewarm : create_app(prewarm=True)（重いモジュールをバックグラウンドで読み込む）
+  - eager   : 従来と同様に重いモジュールを先に読み込んでから create_app()
+
+lazyモードでは、create_app() と GET / の後に重いモジュールが未読み込みであることを検証します。
+
+使い方: python bench_startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_CSV = os.path.join(PROJECT_DIR, 'user_data', 'uploads', 'Feature.csv')
+
+CHILD_SCRIPT = """
+import time
+t0 = time.perf_counter()
+import io
+import sys
+mode = {mode!r}
+if mode == 'eager':
+    from app.main import HEAVY_MODULES
+    import importlib
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+from app.main import create_app
+app = create_app(prewarm=(mode == 'prewarm'))
+client = app.test_client()
+response = client.get('/')
+assert response.status_code == 200, response.status_code
+t_ready = time.perf_counter() - t0
+if mode == 'lazy':
+    loaded = [name for name in ('pandas', 'numpy', 'numexpr', 'plotly') if name in sys.modules]
+    assert not loaded, f'heavy modules loaded before first data request: {{loaded}}'
+
+# アップロード先に同名で保存されるため、内容を先にメモリへ読み込んでおく
+with open({csv_path!r}, 'rb') as f:
+    csv_bytes = f.read()
+response = client.post('/upload_csv', data={{
+    'file_type': 'feature',
+    'file': (io.BytesIO(csv_bytes), {csv_name!r}),
+}}, content_type='multipart/form-data')
+assert response.status_code == 200, response.get_data(as_text=True)
+t_data = time.perf_counter() - t0
+print(t_ready, t_data)
+"""
+
+MODES = ('lazy', 'prewarm', 'eager')
+
+
+def measure_once(mode):
+    """
+    新しいプロセスで1回計測し、(process, ready, data) の秒数を返します。
+    """
+    script = CHILD_SCRIPT.format(mode=mode, csv_path=SAMPLE_CSV, csv_name=os.path.basename(SAMPLE_CSV))
+    start = time.perf_counter()
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=PROJECT_DIR, text=True)
+    wall = time.perf_counter() - start
+    t_ready, t_data = (float(v) for v in output.strip().splitlines()[-1].split())
+    return wall, t_ready, t_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure time-to-first-request of the Flask app.')
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh processes per mode')
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'process [ms]':>13} {'ready [ms]':>11} {'data [ms]':>10}   (median of {args.runs})")
+    for mode in MODES:
+        samples = [measure_once(mode) for _ in range(args.runs)]
+        wall, ready, data = (statistics.median(s[i] for s in samples) * 1000 for i in range(3))
+        print(f"{mode:<8} {wall:>13.1f} {ready:>11.1f} {data:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,18 @@ MESH_FOLDER = os.path.join(USER_DATA_DIR, 'mesh')
 # Flaskセッション用の秘密鍵（重要：本番環境では、強力でランダムな値に変更してください）
 SECRET_KEY = 'super_secret_key_for_mierio_app'
 
-# 各ディレクトリが存在しない場合は作成する
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(JSON_SUBFOLDER, exist_ok=True)
+# 重いモジュール（pandas, numpy, numexpr, plotly）をバックグラウンドで事前に読み込むかどうか
+# 環境変数 MIERIO_PREWARM_IMPORTS=1 で有効化
+# 注意: 事前読み込みはfork後のワーカープロセス内で開始すること。
+# gunicorn --preload のようにマスターでアプリを読み込んでからforkする構成では、
+# インポートロックを保持したままforkされ、ワーカーが初回インポートで停止する恐れがある。
+PREWARM_IMPORTS = os.environ.get('MIERIO_PREWARM_IMPORTS', '0') == '1'
+
+
+def ensure_user_dirs():
+    """
+    各ディレクトリが存在しない場合は作成します。
+    インポート時の副作用を避けるため、アプリ生成時に呼び出されます。
+    """
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    os.makedirs(JSON_SUBFOLDER, exist_ok=True)
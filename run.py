@@ -1,6 +1,8 @@
-from app.main import app
+from app.main import create_app
+
+app = create_app()
 
 if __name__ == '__main__':
     # デバッグモードを有効にして、コード変更時に自動でリロードされるようにする
     # 本番環境ではdebug=Falseに設定
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)